@@ -7,21 +7,25 @@
 
 
 import asyncio
+import contextvars
+import functools
 import grp
 import itertools
-import mimetypes
+import os
 import pwd
-import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from stat import filemode
+from stat import S_ISDIR, S_ISREG, filemode
+from typing import TypeVar
 
-from rich import filesize
 from rich.highlighter import Highlighter
-from rich.syntax import Syntax
+from rich.style import Style
 from rich.text import Text
-from textual import events, on, work
+from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.cache import LRUCache
@@ -30,10 +34,174 @@ from textual.message import Message
 from textual.reactive import reactive, var
 from textual.screen import ModalScreen
 from textual.suggester import Suggester
+from textual.timer import Timer
 from textual.validation import ValidationResult, Validator
 from textual.widgets import DirectoryTree, Footer, Input, Label, Static, Tree
 from textual.widgets.directory_tree import DirEntry
-from textual.worker import get_current_worker
+from textual.widgets.tree import TreeNode
+from textual.worker import Worker, get_current_worker
+
+# The home directory doesn't change while we are running, so we only need to expand it once.
+_HOME = str(Path("~").expanduser())
+
+# Extensions we know to be text, which we can preview without consulting mimetypes.
+_TEXT_EXTENSIONS = frozenset(
+    {
+        ".bash",
+        ".bat",
+        ".c",
+        ".cfg",
+        ".conf",
+        ".cpp",
+        ".cs",
+        ".css",
+        ".csv",
+        ".fish",
+        ".go",
+        ".h",
+        ".hpp",
+        ".html",
+        ".ini",
+        ".java",
+        ".js",
+        ".json",
+        ".jsx",
+        ".kt",
+        ".log",
+        ".lua",
+        ".md",
+        ".php",
+        ".pl",
+        ".ps1",
+        ".py",
+        ".r",
+        ".rb",
+        ".rs",
+        ".rst",
+        ".scala",
+        ".sh",
+        ".sql",
+        ".svg",
+        ".swift",
+        ".toml",
+        ".ts",
+        ".tsx",
+        ".txt",
+        ".vue",
+        ".xml",
+        ".yaml",
+        ".yml",
+        ".zsh",
+    }
+)
+
+# Mimetypes which we can preview as text.
+_TEXT_MIME_TYPES = (
+    "text/",
+    "application/json",
+    "application/xml",
+    "application/javascript",
+)
+
+# Mimetypes which are clearly not text, so we don't need to read the file to know.
+_BINARY_MIME_TYPES = (
+    "image/",
+    "audio/",
+    "video/",
+    "font/",
+    "application/gzip",
+    "application/vnd.rar",
+    "application/x-7z-compressed",
+    "application/x-bzip2",
+    "application/x-rar-compressed",
+    "application/x-tar",
+    "application/x-xz",
+    "application/zip",
+)
+
+# Files larger than this, which we don't know to be text, won't be previewed.
+_MAX_PREVIEW_SIZE = 2 * 1024 * 1024
+
+
+@functools.cache
+def extension_is_text() -> dict[str, bool]:
+    """Get a dict that maps extensions on to a bool that indicates if the mimetype is text.
+
+    Extensions with a mimetype that is neither clearly text nor clearly binary (such as
+    `application/sql`) are left out, so the file contents can decide.
+
+    Initializing mimetypes reads files from disk, so we defer it until the first preview.
+
+    """
+    import mimetypes
+
+    mimetypes.init()
+    is_text: dict[str, bool] = {}
+    for extension, mime_type in mimetypes.types_map.items():
+        if mime_type.startswith(_TEXT_MIME_TYPES):
+            is_text[extension] = True
+        elif mime_type.startswith(_BINARY_MIME_TYPES) and mime_type != "image/svg+xml":
+            is_text[extension] = False
+    return is_text
+
+
+T = TypeVar("T")
+
+# Limits the number of filesystem calls running in threads at any one time.
+_fs_semaphore = asyncio.BoundedSemaphore(8)
+
+
+async def fs_call(function: Callable[..., T], *args: object) -> T:
+    """Call a blocking filesystem function in a thread.
+
+    The number of concurrent calls is limited, so that bursts of activity (such as
+    holding down a cursor key) can't exhaust threads or file descriptors.
+
+    Args:
+        function: A function to call.
+        *args: Positional arguments for the function.
+
+    Returns:
+        The return value of the function.
+    """
+    await _fs_semaphore.acquire()
+    try:
+        # Like asyncio.to_thread, the function runs with a copy of the current context.
+        context = contextvars.copy_context()
+        future = asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(context.run, function, *args)
+        )
+    except BaseException:
+        _fs_semaphore.release()
+        raise
+
+    def on_done(future: asyncio.Future[T]) -> None:
+        """Release the permit when the thread finishes, not when the caller stops waiting."""
+        _fs_semaphore.release()
+        if not future.cancelled():
+            # Retrieve the exception, to avoid a warning if the caller was cancelled.
+            future.exception()
+
+    future.add_done_callback(on_done)
+    # A cancelled caller can't stop the thread, so the permit is held until it finishes.
+    return await asyncio.shield(future)
+
+
+def expand_home(path: str) -> str:
+    """Expand a leading "~" in a path, without looking up the home directory each time.
+
+    Args:
+        path: A path which may begin with "~".
+
+    Returns:
+        The path with the home directory expanded.
+    """
+    if not path.startswith("~"):
+        return path
+    if path == "~" or path.startswith("~/"):
+        return _HOME + path[1:]
+    # Another user's home directory (~user)
+    return os.path.expanduser(path)
 
 
 class DirectoryHighlighter(Highlighter):
@@ -44,15 +212,50 @@ class DirectoryHighlighter(Highlighter):
 
     Here we are highlighting valid directory paths in green, and invalid directory paths in red.
 
+    Checking for a directory is blocking I/O, which we don't want to do while rendering.
+    So results are cached, and a cache miss is checked in a thread. The text is left
+    unstyled until the result is known, at which point `on_update` is called.
+
+    The cache may be shared with a `DirectoryValidator`, so that values it has already
+    validated are highlighted without any I/O.
+
     """
 
+    def __init__(
+        self,
+        on_update: Callable[[], object] | None = None,
+        is_dir_cache: LRUCache[str, bool] | None = None,
+    ) -> None:
+        self._on_update = on_update
+        self._is_dir_cache = LRUCache(256) if is_dir_cache is None else is_dir_cache
+        self._probes: dict[str, asyncio.Task[None]] = {}
+
     def highlight(self, text: Text) -> None:
-        path = Path(text.plain).expanduser().resolve()
-        if path.is_dir():
+        value = text.plain
+        is_dir = self._is_dir_cache.get(value)
+        if is_dir is None:
+            if value not in self._probes:
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    # Not called from the app (no event loop), so leave the text unstyled.
+                    return
+                self._probes[value] = loop.create_task(self._probe(value))
+        elif is_dir:
             text.stylize("green")
         else:
             text.stylize("red")
 
+    async def _probe(self, value: str) -> None:
+        """Check if a value is a directory in a thread, and request a re-highlight."""
+        try:
+            is_dir = await fs_call(os.path.isdir, expand_home(value))
+            self._is_dir_cache[value] = is_dir
+        finally:
+            del self._probes[value]
+        if self._on_update is not None:
+            self._on_update()
+
 
 class DirectoryValidator(Validator):
     """Validate a string is a valid directory path.
@@ -62,9 +265,30 @@ class DirectoryValidator(Validator):
 
     """
 
+    def __init__(self, is_dir_cache: LRUCache[str, bool] | None = None) -> None:
+        """Initialize the validator.
+
+        Args:
+            is_dir_cache: A cache of directory checks, which may be shared with a `DirectoryHighlighter`.
+        """
+        super().__init__()
+        # Validation runs on every keystroke, and the user will often backspace and retype.
+        self._cache = LRUCache(128) if is_dir_cache is None else is_dir_cache
+
     def validate(self, value: str) -> ValidationResult:
-        path = Path(value).expanduser().resolve()
-        if path.is_dir():
+        is_dir = self._cache.get(value)
+        if is_dir is None:
+            parent = os.path.dirname(value.rstrip("/"))
+            # A NUL can't appear in a POSIX path, so there is no need to ask the filesystem.
+            if not value or "\0" in value:
+                is_dir = False
+            elif parent and self._cache.get(parent) is False:
+                # Nothing inside something which isn't a directory can be a directory.
+                is_dir = False
+            else:
+                is_dir = os.path.isdir(expand_home(value))
+            self._cache[value] = is_dir
+        if is_dir:
             return self.success()
         else:
             return self.failure("Directory required", value)
@@ -77,30 +301,98 @@ class ListDirCache:
 
     Listing a directory is a blocking operation, which is why we defer the work to a thread.
 
+    Listings are checked again after `max_age` seconds, so that changes on disk are
+    picked up. A directory is only scanned again if its modification time has changed.
+
     """
 
-    def __init__(self) -> None:
-        self._cache: LRUCache[tuple[str, int], list[Path]] = LRUCache(100)
-        self._lock = threading.Lock()
+    def __init__(self, max_age: float = 5.0) -> None:
+        self.max_age = max_age
+        self._cache: LRUCache[
+            tuple[str, int], tuple[float, int, list[tuple[str, bool, str]]]
+        ] = LRUCache(100)
+        # Listings in progress, so concurrent requests for the same directory share a thread.
+        self._inflight: dict[
+            tuple[str, int], asyncio.Future[list[tuple[str, bool, str]]]
+        ] = {}
+
+    async def listdir(self, path: Path, size: int) -> list[tuple[str, bool, str]]:
+        directory = os.fspath(path)
+        cache_key = (directory, size)
+
+        def iterdir_thread(
+            directory: str, previous: tuple[int, list[tuple[str, bool, str]]] | None
+        ) -> tuple[int, list[tuple[str, bool, str]]]:
+            """Run scandir in a thread.
 
-    async def listdir(self, path: Path, size: int) -> list[Path]:
-        cache_key = (str(path), size)
+            Scandir gets the file type along with the name, so we don't need
+            an additional stat to know if an entry is a directory.
 
-        def iterdir_thread(path: Path) -> list[Path]:
-            """Run iterdir in a thread.
+            Names are case-folded here, once per listing, as they are only used
+            for case-insensitive matching.
+
+            Args:
+                directory: Directory to scan.
+                previous: The previous (modified time, listing), if there is one.
 
             Returns:
-                A list of paths.
+                The directory's modified time (ns) and a list of (folded name, is_dir, name) tuples.
             """
-            return list(itertools.islice(path.iterdir(), size))
-
-        with self._lock:
-            if cache_key in self._cache:
-                paths = self._cache[cache_key]
-            else:
-                paths = await asyncio.to_thread(iterdir_thread, path)
-                self._cache[cache_key] = paths
+            # Scanning from a file descriptor lets us close the directory deterministically.
+            fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+            try:
+                modified_time = os.fstat(fd).st_mtime_ns
+                if previous is not None and previous[0] == modified_time:
+                    # Nothing has been added or removed
+                    return previous
+                with os.scandir(fd) as entries:
+                    return modified_time, list(
+                        itertools.islice(
+                            (
+                                (
+                                    entry.name.casefold(),
+                                    entry.is_dir(),
+                                    entry.name,
+                                )
+                                for entry in entries
+                            ),
+                            size,
+                        )
+                    )
+            finally:
+                os.close(fd)
+
+        # Everything here runs on the event loop, so there is no need for a lock.
+        cached = self._cache.get(cache_key)
+        previous: tuple[int, list[tuple[str, bool, str]]] | None = None
+        if cached is not None:
+            checked_time, modified_time, paths = cached
+            if time.monotonic() - checked_time < self.max_age:
+                return paths
+            previous = (modified_time, paths)
+        if cache_key in self._inflight:
+            return await asyncio.shield(self._inflight[cache_key])
+
+        future: asyncio.Future[list[tuple[str, bool, str]]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[cache_key] = future
+        try:
+            modified_time, paths = await fs_call(iterdir_thread, directory, previous)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            # Retrieve the exception, to avoid a warning if nothing else is waiting.
+            future.exception()
+            raise
+        else:
+            self._cache[cache_key] = (time.monotonic(), modified_time, paths)
+            future.set_result(paths)
             return paths
+        finally:
+            del self._inflight[cache_key]
 
 
 class DirectorySuggester(Suggester):
@@ -115,52 +407,217 @@ class DirectorySuggester(Suggester):
         self._cache = ListDirCache()
         super().__init__()
 
+    async def prewarm(self, *directories: Path) -> None:
+        """List directories ahead of time, so the first suggestions are instant.
+
+        Args:
+            *directories: Directories the user is likely to complete in.
+        """
+        for directory in directories:
+            try:
+                await self._cache.listdir(directory, 100)
+            except OSError:
+                pass
+
     async def get_suggestion(self, value: str) -> str | None:
         """Suggest the first matching directory."""
 
         try:
-            path = Path(value)
-            name = path.name
-
-            children = await self._cache.listdir(
-                path.expanduser() if path.is_dir() else path.parent.expanduser(), 100
-            )
-            possible_paths = [
-                f"{sibling_path}/"
-                for sibling_path in children
-                if sibling_path.name.lower().startswith(name.lower())
-                and sibling_path.is_dir()
-            ]
-            if possible_paths:
-                possible_paths.sort(key=str.__len__)
-                suggestion = possible_paths[0]
-
-                if "~" in value:
-                    home = str(Path("~").expanduser())
-                    suggestion = suggestion.replace(home, "~", 1)
-                return suggestion
-
-        except FileNotFoundError:
+            # We can tell if the user is completing inside a directory from the
+            # trailing slash, which saves a stat on every keystroke.
+            if value == "~":
+                value = "~/"
+            # The suggestion is built from what the user typed, so "~" and relative
+            # paths are suggested as they were entered.
+            head, separator, name = value.rpartition("/")
+            prefix = head + separator
+            directory = expand_home(prefix) or "."
+
+            children = await self._cache.listdir(Path(directory), 100)
+            # Find the shortest matching directory in a single pass.
+            # An exact match can't be beaten, so we can stop early.
+            folded_name = name.casefold()
+            best_name: str | None = None
+            for entry_folded_name, is_dir, entry_name in children:
+                if not is_dir or not entry_folded_name.startswith(folded_name):
+                    continue
+                if best_name is None or len(entry_name) < len(best_name):
+                    best_name = entry_name
+                if entry_folded_name == folded_name:
+                    break
+            if best_name is not None:
+                return f"{prefix}{best_name}/"
+
+        except OSError:
             pass
         return None
 
 
-class PathComponent(Label):
-    """Clickable component in a path.
+# Systems have few users and groups, so we can remember every name we look up.
+_uid_names: dict[int, str] = {}
+_gid_names: dict[int, str] = {}
+
+
+def uid_name(uid: int) -> str:
+    """Get a user name from a uid.
 
-    A simple widget that displays text with a hover effect, that sends
-    a message when clicked.
+    Name lookups may go over the network on some systems, so we cache the results.
 
+    Args:
+        uid: A user id.
+
+    Returns:
+        The user name, or the uid as a string if there is no user name.
     """
+    try:
+        return _uid_names[uid]
+    except KeyError:
+        pass
+    try:
+        name = pwd.getpwuid(uid).pw_name
+    except KeyError:
+        name = str(uid)
+    return _uid_names.setdefault(uid, name)
+
+
+def gid_name(gid: int) -> str:
+    """Get a group name from a gid.
+
+    Args:
+        gid: A group id.
+
+    Returns:
+        The group name, or the gid as a string if there is no group name.
+    """
+    try:
+        return _gid_names[gid]
+    except KeyError:
+        pass
+    try:
+        name = grp.getgrgid(gid).gr_name
+    except KeyError:
+        name = str(gid)
+    return _gid_names.setdefault(gid, name)
+
+
+def preload_names() -> None:
+    """Load all user and group names in one go.
+
+    This is blocking, and should be run in a thread. Afterwards, `uid_name` and
+    `gid_name` won't need to query the name service for most ids.
+
+    """
+    for user in pwd.getpwall():
+        _uid_names.setdefault(user.pw_uid, user.pw_name)
+    for group in grp.getgrall():
+        _gid_names.setdefault(group.gr_gid, group.gr_name)
+
+
+_SIZE_SUFFIXES = ("kB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
+
+
+def decimal_size(size: int) -> str:
+    """Format a size in bytes with decimal units.
+
+    Produces the same output as `rich.filesize.decimal`, but picks the unit from
+    the number of digits rather than looping over the units.
+
+    Args:
+        size: A size in bytes.
+
+    Returns:
+        A human readable size, e.g. "1.5 kB".
+    """
+    if size == 1:
+        return "1 byte"
+    if size < 1000:
+        return f"{size:,} bytes"
+    exponent = min((len(str(size)) - 1) // 3, len(_SIZE_SUFFIXES))
+    return f"{size / 1000**exponent:,.1f} {_SIZE_SUFFIXES[exponent - 1]}"
+
+
+# Directory listings repeat the same modes constantly.
+cached_filemode = functools.lru_cache(maxsize=256)(filemode)
+
+
+_current_year = datetime.now().year
+_current_year_checked = time.monotonic()
+
+
+def current_year() -> int:
+    """Get the current year, checking the clock at most once an hour."""
+    global _current_year, _current_year_checked
+    if time.monotonic() - _current_year_checked > 60 * 60:
+        _current_year = datetime.now().year
+        _current_year_checked = time.monotonic()
+    return _current_year
+
+
+@dataclass(frozen=True)
+class FileInfo:
+    """Information about a file, formatted for the InfoBar."""
+
+    mode: str
+    user_name: str
+    group_name: str
+    modified_time: str
+    size: str | None
+    """Size of the file, or `None` for directories."""
+    size_bytes: int
+
+
+class StatCache:
+    """A cache for file information (not a Rich / Textual object).
+
+    Stat and user / group lookups can be slow on network filesystems and name services,
+    and the same paths are highlighted repeatedly as the cursor moves.
+
+    Entries expire after `max_age` seconds, so that changes on disk are picked up.
 
-    DEFAULT_CSS = """
-    PathComponent {
-      &:hover { text-style: reverse; }  
-    }
     """
 
-    def on_click(self, event: events.Click) -> None:
-        self.post_message(PathNavigator.NewPath(Path(self.name or "")))
+    def __init__(self, max_age: float = 2.0) -> None:
+        self.max_age = max_age
+        self._cache: LRUCache[str, tuple[float, FileInfo]] = LRUCache(512)
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        self._cache.clear()
+
+    async def get_info(self, path: Path) -> FileInfo:
+        """Get information about a file.
+
+        Args:
+            path: A path.
+
+        Returns:
+            File information.
+        """
+        cache_key = os.fspath(path)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            updated_time, file_info = cached
+            if time.monotonic() - updated_time < self.max_age:
+                return file_info
+
+        def get_info_thread() -> FileInfo:
+            """Stat, look up names, and format everything in a single thread hop."""
+            stat = os.stat(cache_key)
+            is_dir = S_ISDIR(stat.st_mode)
+            return FileInfo(
+                mode=cached_filemode(stat.st_mode),
+                user_name=uid_name(stat.st_uid),
+                group_name=gid_name(stat.st_gid),
+                modified_time=InfoBar.datetime_to_ls_format(
+                    datetime.fromtimestamp(stat.st_mtime)
+                ),
+                size=None if is_dir else decimal_size(stat.st_size),
+                size_bytes=stat.st_size,
+            )
+
+        file_info = await fs_call(get_info_thread)
+        self._cache[cache_key] = (time.monotonic(), file_info)
+        return file_info
 
 
 class InfoBar(Horizontal):
@@ -184,12 +641,36 @@ class InfoBar(Horizontal):
     }
     """
 
-    path: reactive[Path] = reactive(Path, recompose=True)
+    path: reactive[Path] = reactive(Path)
+    # None means the stat failed. The watcher doesn't run until the first result,
+    # and always runs after a failure, so a placeholder is shown while loading.
+    file_info: var[FileInfo | None] = var(None, init=False, always_update=True)
+
+    def __init__(self) -> None:
+        super().__init__()
+        # The labels are created once, and updated when the path changes.
+        self._labels = {
+            name: Label(classes=name)
+            for name in (
+                "loading",
+                "error",
+                "mode",
+                "user-name",
+                "group-name",
+                "modified-time",
+                "file-size",
+            )
+        }
+        self._labels["loading"].update("…")
+        self._labels["error"].update("failed to get file info")
+        for name, label in self._labels.items():
+            label.display = name == "loading"
+        self.stat_cache = StatCache()
 
     @staticmethod
     def datetime_to_ls_format(date_time: datetime) -> str:
         """Convert a datetime object to a string format similar to ls -la output."""
-        if date_time.year == datetime.now().year:
+        if date_time.year == current_year():
             # For dates in the current year, use format: "day month HH:MM"
             return date_time.strftime("%d %b %H:%M")
         else:
@@ -197,63 +678,94 @@ class InfoBar(Horizontal):
             return date_time.strftime("%d %b %Y")
 
     def compose(self) -> ComposeResult:
+        yield from self._labels.values()
+
+    def watch_path(self, path: Path) -> None:
+        self.update_info(path)
+
+    @work(exclusive=True, group="infobar")
+    async def update_info(self, path: Path) -> None:
+        """Load file information in a worker, so the stat doesn't block the UI.
+
+        Args:
+            path: A Path to the file to show information for.
+        """
         try:
-            stat = self.path.stat()
+            self.file_info = await self.stat_cache.get_info(path)
         except Exception:
-            yield Label("failed to get file info", classes="error")
-        else:
-            user_name = pwd.getpwuid(stat.st_uid).pw_name
-            group_name = grp.getgrgid(stat.st_gid).gr_name
-            modified_time = datetime.fromtimestamp(stat.st_mtime)
-
-            yield Label(filemode(stat.st_mode), classes="mode")
-            yield Label(user_name, classes="user-name")
-            yield Label(group_name, classes="group-name")
-            yield Label(
-                self.datetime_to_ls_format(modified_time), classes="modified-time"
+            self.file_info = None
+
+    def watch_file_info(self, file_info: FileInfo | None) -> None:
+        """Update the labels from the file information, with no I/O."""
+        labels = self._labels
+        if file_info is None:
+            for name, label in labels.items():
+                label.display = name == "error"
+            return
+
+        labels["mode"].update(file_info.mode)
+        labels["user-name"].update(file_info.user_name)
+        labels["group-name"].update(file_info.group_name)
+        labels["modified-time"].update(file_info.modified_time)
+        if file_info.size is not None:
+            labels["file-size"].update(file_info.size)
+            labels["file-size"].tooltip = f"{file_info.size_bytes} bytes"
+        for name, label in labels.items():
+            label.display = name not in ("loading", "error") and (
+                file_info.size is not None or name != "file-size"
             )
-            if not self.path.is_dir():
-                label = Label(filesize.decimal(stat.st_size), classes="file-size")
-                label.tooltip = f"{stat.st_size} bytes"
-                yield label
 
 
-class PathDisplay(Horizontal):
+class PathDisplay(Static):
     """A widget to display the path at the top of the UI.
 
-    Not just simple text, this consists of clickable path components.
+    Not just simple text, each component of the path may be clicked.
+
+    Rather than a widget per component, the path is a single Text object with
+    click actions embedded in the style, so a path change is a single update.
 
     """
 
     DEFAULT_CSS = """
     PathDisplay {
-        layout: horizontal;
         height: 1;
         dock: top;
-        align: center top;
+        text-align: center;
         text-style: bold;
         color: ansi_green;
-        .separator { margin: 0 0; }      
+        link-color: ansi_green;
+        link-background: transparent;
+        link-style: bold not underline;
+        link-color-hover: ansi_green;
+        link-background-hover: transparent;
+        link-style-hover: bold reverse not underline;
     }
     """
 
-    path: reactive[Path] = reactive(Path, recompose=True)
+    path: reactive[Path] = reactive(Path)
 
-    def compose(self) -> ComposeResult:
-        path = self.path.resolve().absolute()
-
-        yield Label("📁 ", classes="separator")
-        components = str(path).split("/")
-        root_component = PathComponent("/", name="/")
-        root_component.tooltip = "/"
-        yield root_component
-        for index, component in enumerate(components, 1):
-            partial_path = "/".join(components[:index])
-            component_label = PathComponent(component, name=partial_path)
-            component_label.tooltip = partial_path
-            yield component_label
-            if index > 1 and index < len(components):
-                yield Label("/", classes="separator")
+    @staticmethod
+    def click_style(path: str) -> Style:
+        """Get a style that will navigate to the given path when clicked."""
+        return Style(meta={"@click": f"go({path!r})"})
+
+    def watch_path(self, path: Path) -> None:
+        # The path has already been resolved by PathNavigator.validate_path,
+        # so the first part is the root, and pathlib has already split the rest.
+        components = path.parts[1:]
+        text = Text("📁 ")
+        text.append(os.sep, self.click_style(os.sep))
+        partial_path = ""
+        for index, component in enumerate(components):
+            if index:
+                text.append(os.sep)
+            partial_path = f"{partial_path}{os.sep}{component}"
+            text.append(component, self.click_style(partial_path))
+        self.update(text)
+
+    def action_go(self, path: str) -> None:
+        """Navigate to a path component."""
+        self.post_message(PathNavigator.NewPath(Path(path)))
 
 
 class PathScreen(ModalScreen[str | None]):
@@ -299,20 +811,32 @@ class PathScreen(ModalScreen[str | None]):
     def __init__(self, path: str) -> None:
         super().__init__()
         self.path = path.rstrip("/") + "/"
+        self._suggester = DirectorySuggester()
 
     def compose(self) -> ComposeResult:
         with Horizontal():
             yield Label("📂")
+            # The highlighter and validator share a cache, so a path is only checked once.
+            is_dir_cache: LRUCache[str, bool] = LRUCache(256)
             # The validator and suggester instances pack a lot of functionality in to this input.
-            yield Input(
+            path_input = Input(
                 value=self.path,
-                validators=[DirectoryValidator()],
-                suggester=DirectorySuggester(),
+                validators=[DirectoryValidator(is_dir_cache)],
+                suggester=self._suggester,
                 classes="-ansi-colors",
             )
+            path_input.highlighter = DirectoryHighlighter(
+                on_update=path_input.refresh, is_dir_cache=is_dir_cache
+            )
+            yield path_input
         yield (footer := Footer(classes="-ansi-colors"))
         footer.compact = True
 
+    def on_mount(self) -> None:
+        # The user will most likely complete in the current directory, or a sibling.
+        path = Path(self.path)
+        self.run_worker(self._suggester.prewarm(path, path.parent))
+
     @on(Input.Submitted)
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """If the user submits the input (with enter), we return the value of the input to the caller."""
@@ -353,7 +877,22 @@ class PreviewWindow(ScrollableContainer):
 
     path: var[Path] = var(Path)
 
-    @work(exclusive=True)
+    def __init__(self) -> None:
+        super().__init__()
+        # Guessing the lexer is relatively expensive, and is mostly determined by the suffix.
+        self._lexer_cache: LRUCache[str, str] = LRUCache(256)
+
+    def show_unavailable(self, message: str | None = None) -> None:
+        """Show a message when we can't preview a file.
+
+        Args:
+            message: Message to show, or `None` for a generic message.
+        """
+        content = self.query_one("#content", Static)
+        self.call_later(content.update, message or "Preview not available")
+        self.add_class("-preview-unavailable")
+
+    @work(exclusive=True, group="preview")
     async def update_syntax(self, path: Path) -> None:
         """Update the preview in a worker.
 
@@ -362,55 +901,139 @@ class PreviewWindow(ScrollableContainer):
         Args:
             path: A Path to the file to get the content for.
         """
+        # Syntax imports Pygments, which is slow to import, and the preview is hidden by default.
+        from rich.syntax import Syntax
+
         worker = get_current_worker()
         content = self.query_one("#content", Static)
-        if path.is_file():
-            _file_type, encoding = mimetypes.guess_type(str(path))
-
-            # A text file, we can attempt to syntax highlight it
-            def read_lines() -> list[str] | None:
-                """A function to read lines from path in a thread."""
-                try:
-                    with open(path, "rt", encoding=encoding or "utf-8") as text_file:
-                        return text_file.readlines(1024 * 32)
-                except Exception:
-                    # We could be more precise with error handling here, but for now
-                    # we will treat all errors as fails.
-                    return None
-
-            # Read the lines in a thread so as not to pause the UI
-            lines = await asyncio.to_thread(read_lines)
-            if lines is None:
-                self.call_later(content.update, "Preview not available")
-                self.add_class("-preview-unavailable")
-                return
 
-            if worker.is_cancelled:
-                return
+        def read_preview() -> tuple[str, str] | None:
+            """A function to do all the file I/O for the preview in a thread.
 
-            code = "".join(lines)
-            lexer = Syntax.guess_lexer(str(path), code)
+            Returns:
+                A tuple of (code, kind), where kind is "text", "binary", or "unavailable".
+                Or `None` if the path is not a regular file.
+            """
             try:
-                syntax = Syntax(
-                    code,
-                    lexer,
-                    word_wrap=False,
-                    indent_guides=True,
-                    line_numbers=True,
-                    theme="ansi_light",
-                )
+                stat_result = os.stat(path)
+            except OSError:
+                return None
+            # Only regular files, we don't want to block reading a FIFO or device.
+            if not S_ISREG(stat_result.st_mode):
+                return None
+            if not stat_result.st_size:
+                return ("", "text")
+            suffix = path.suffix.lower()
+            # Common text files don't need a lookup in the (larger) mimetypes table.
+            is_text = suffix in _TEXT_EXTENSIONS or extension_is_text().get(suffix)
+            # Don't read anything from files we know aren't text.
+            if is_text is False:
+                return ("", "binary")
+            if is_text is None and stat_result.st_size > _MAX_PREVIEW_SIZE:
+                return ("", "unavailable")
+            try:
+                with open(path, "rb") as binary_file:
+                    # A hard limit, so long lines (e.g. minified files) can't read the whole file.
+                    data = binary_file.read(64_000)
+                # Not known to be text, check the start of the file for binary data.
+                if not is_text and b"\x00" in data[:1024]:
+                    return ("", "binary")
+                return (data.decode("utf-8", errors="replace"), "text")
             except Exception:
-                return
-            content.update(syntax)
-            self.remove_class("-preview-unavailable")
+                # We could be more precise with error handling here, but for now
+                # we will treat all errors as fails.
+                return ("", "unavailable")
+
+        if worker.is_cancelled:
+            return
+        # Do the I/O in a thread so as not to pause the UI
+        result = await fs_call(read_preview)
+        if result is None or worker.is_cancelled:
+            return
+        code, kind = result
+        if kind != "text":
+            self.show_unavailable("Binary file" if kind == "binary" else None)
+            return
+
+        # Without a suffix, the lexer depends on the name or the code (e.g. a shebang).
+        suffix = path.suffix
+        lexer = self._lexer_cache.get(suffix) if suffix else None
+        if lexer is None:
+            lexer = Syntax.guess_lexer(str(path), code)
+            if suffix:
+                self._lexer_cache[suffix] = lexer
+        try:
+            syntax = Syntax(
+                code,
+                lexer,
+                word_wrap=False,
+                indent_guides=True,
+                line_numbers=True,
+                theme="ansi_light",
+            )
+        except Exception:
+            return
+        content.update(syntax)
+        self.remove_class("-preview-unavailable")
 
     def watch_path(self, path: Path) -> None:
+        # Cancel the previous preview now, so it doesn't start any more I/O.
+        self.workers.cancel_group(self, "preview")
         self.update_syntax(path)
 
     def compose(self) -> ComposeResult:
         yield Static("", id="content")
 
 
+class ScandirDirectoryTree(DirectoryTree):
+    """A DirectoryTree which lists directories with `os.scandir`.
+
+    The base class calls `is_dir()` for every entry when sorting a directory, and again
+    (on the event loop) when adding the entries to the tree. Scandir returns the file type
+    along with the name, so we remember it and skip those stats.
+
+    This relies on private `DirectoryTree` methods (`_directory_content`, `_populate_node`
+    and `_safe_is_dir`), which are present from Textual 0.85.2 through 8.x.
+
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # File types from the most recent scan. Loads are serialized by the tree's lock,
+        # so each scan replaces the map rather than adding to it.
+        self._is_dir: dict[Path, bool] = {}
+
+    def _safe_is_dir(self, path: Path) -> bool:
+        is_dir = self._is_dir.get(path)
+        if is_dir is None:
+            return super()._safe_is_dir(path)
+        return is_dir
+
+    def _directory_content(self, location: Path, worker: Worker) -> Iterator[Path]:
+        # A new map per scan, so a cancelled or failed scan can't leave entries behind,
+        # and a cancelled thread which is still running can't write to the current map.
+        is_dir: dict[Path, bool] = {}
+        self._is_dir = is_dir
+        try:
+            with os.scandir(location) as entries:
+                for entry in entries:
+                    if worker.is_cancelled:
+                        break
+                    path = Path(entry.path)
+                    try:
+                        is_dir[path] = entry.is_dir()
+                    except OSError:
+                        is_dir[path] = False
+                    yield path
+        except OSError:
+            pass
+
+    def _populate_node(self, node: TreeNode[DirEntry], content: Iterable[Path]) -> None:
+        super()._populate_node(node, content)
+        # The file types are only needed while loading.
+        self._is_dir = {}
+
+
 class PathNavigator(Horizontal):
     """The top-level widget, containing the directory tree and preview window."""
 
@@ -448,13 +1071,31 @@ class PathNavigator(Horizontal):
 
         path: Path
 
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, prefetch: bool = False) -> None:
+        """Initialize the navigator.
+
+        Args:
+            path: The initial root path.
+            prefetch: Stat the entries below a new root path in the background. This makes
+                navigating a cold network filesystem faster, at the cost of extra I/O.
+        """
         super().__init__()
+        self._prefetch = prefetch
+        self._resolved_paths: LRUCache[str, Path] = LRUCache(128)
+        self._highlight_timer: Timer | None = None
         self.path = path
 
     def validate_path(self, path: Path) -> Path:
         """Called to validate the path reactive."""
-        return path.expanduser().resolve()
+        if path.is_absolute() and ".." not in path.parts:
+            # Already absolute and normalized, no need to walk the filesystem.
+            return path
+        path_str = os.fspath(path)
+        resolved_path = self._resolved_paths.get(path_str)
+        if resolved_path is None:
+            resolved_path = Path(expand_home(path_str)).resolve()
+            self._resolved_paths[path_str] = resolved_path
+        return resolved_path
 
     def on_mount(self) -> None:
         self.post_message(PathNavigator.NewPath(self.path))
@@ -465,8 +1106,28 @@ class PathNavigator(Horizontal):
     @on(Tree.NodeHighlighted)
     def on_node_highlighted(self, event: Tree.NodeHighlighted[DirEntry]) -> None:
         if event.node.data is not None:
-            self.query_one(InfoBar).path = event.node.data.path
-            self.query_one(PreviewWindow).path = event.node.data.path
+            # Wait for the cursor to rest before updating, so that scrolling
+            # through the tree doesn't stat and read every file it passes.
+            if self._highlight_timer is not None:
+                self._highlight_timer.stop()
+                self._highlight_timer = None
+            path = event.node.data.path
+            if path == self.query_one(InfoBar).path:
+                # Already showing this path, nothing to do.
+                return
+            self._highlight_timer = self.set_timer(
+                0.08, lambda: self.apply_highlight(path), name="highlight"
+            )
+
+    def apply_highlight(self, path: Path) -> None:
+        """Update the info bar and preview with the highlighted path."""
+        self._highlight_timer = None
+        info_bar = self.query_one(InfoBar)
+        if info_bar.path != path:
+            info_bar.path = path
+        preview_window = self.query_one(PreviewWindow)
+        if preview_window.path != path:
+            preview_window.path = path
 
     @on(NewPath)
     def on_new_path(self, event: NewPath) -> None:
@@ -479,12 +1140,67 @@ class PathNavigator(Horizontal):
             )
         else:
             self.path = event.path
-            self.query_one(DirectoryTree).path = event.path
-            self.query_one(PathDisplay).path = event.path
+            self.query_one(DirectoryTree).path = self.path
+            self.query_one(PathDisplay).path = self.path
+            if self._prefetch:
+                self.prefetch(self.path)
+
+    @work(thread=True, exclusive=True, group="prefetch", exit_on_error=False)
+    def prefetch(self, path: Path, depth: int = 2) -> None:
+        """Stat the entries below a path, so that navigating in to it is fast.
+
+        On a cold cache, the first stat of a file may have to go to disk (or the network).
+        This runs those stats in parallel, ahead of time, which warms the operating system's
+        caches, and the user and group name caches.
+
+        Args:
+            path: Path to prefetch.
+            depth: Number of levels to descend.
+        """
+        worker = get_current_worker()
+
+        def scan_directory(directory: str) -> list[str]:
+            """Stat the entries in a directory.
+
+            Returns:
+                A list of sub-directories.
+            """
+            sub_directories: list[str] = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in itertools.islice(entries, 100):
+                        if worker.is_cancelled:
+                            break
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        uid_name(stat.st_uid)
+                        gid_name(stat.st_gid)
+                        if S_ISDIR(stat.st_mode):
+                            sub_directories.append(entry.path)
+            except OSError:
+                pass
+            return sub_directories
+
+        directories = [os.fspath(path)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(depth):
+                if worker.is_cancelled or not directories:
+                    break
+                # Limit the number of directories, so we don't stat too much in the background.
+                directories = list(
+                    itertools.islice(
+                        itertools.chain.from_iterable(
+                            executor.map(scan_directory, directories[:50])
+                        ),
+                        50,
+                    )
+                )
 
     def compose(self) -> ComposeResult:
         yield PathDisplay()
-        tree = DirectoryTree(self.path, classes="-ansi -ansi-scrollbar")
+        tree = ScandirDirectoryTree(self.path, classes="-ansi -ansi-scrollbar")
         tree.guide_depth = 3
         tree.show_root = False
         tree.center_scroll = True
@@ -493,6 +1209,7 @@ class PathNavigator(Horizontal):
         yield InfoBar()
 
     async def action_reload(self) -> None:
+        self.query_one(InfoBar).stat_cache.clear()
         tree = self.query_one(DirectoryTree)
         if tree.cursor_node is None:
             await tree.reload()
@@ -555,6 +1272,8 @@ class NavigatorApp(App):
     def on_mount(self) -> None:
         """Highlight the first line of the directory tree on startup."""
         self.query_one(DirectoryTree).cursor_line = 0
+        # Fetch user and group names up front, rather than one at a time in the InfoBar.
+        self.run_worker(preload_names, thread=True, exit_on_error=False)
 
 
 def run():